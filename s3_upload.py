@@ -0,0 +1,443 @@
+# S3 upload helpers shared by test.py (PDFs) and test2.py (PDFs and images)
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import mmap
+import os
+import stat
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+# boto3 and the app config/S3 session are imported where they are first needed,
+# so --help and input validation failures don't pay for loading botocore
+if TYPE_CHECKING:
+    from boto3.s3.transfer import TransferConfig
+
+logger = logging.getLogger("upload")
+
+MIB = 1024 * 1024
+MULTIPART_THRESHOLD = 16 * MIB
+
+# Transfer tuning defaults; larger parts and more threads than boto3's 8 MiB / 10
+DEFAULT_PART_SIZE_MB = 64
+DEFAULT_CONCURRENCY = 16
+DEFAULT_IO_CHUNKSIZE_KB = 1024
+
+# Files uploaded in parallel by --files
+BATCH_WORKERS = 16
+
+# Lifetime of the presigned PUT URL handed to curl by --presign
+PRESIGN_EXPIRES_IN = 3600
+
+
+@functools.lru_cache(maxsize=None)
+def build_transfer_config(
+    part_size_mb: int = DEFAULT_PART_SIZE_MB,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    io_chunksize_kb: int = DEFAULT_IO_CHUNKSIZE_KB,
+) -> TransferConfig:
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+        multipart_threshold=MULTIPART_THRESHOLD,
+        multipart_chunksize=part_size_mb * MIB,
+        max_concurrency=concurrency,
+        use_threads=True,
+        max_io_queue=1000,
+        io_chunksize=io_chunksize_kb * 1024,
+    )
+
+
+# Socket send blocksize for request bodies; botocore uses 128 KiB, http.client 8 KiB
+HTTP_BLOCKSIZE = 1 * MIB
+
+
+def _tune_http_buffers() -> None:
+    # Must run before an S3 client is built; the pool manager reads the size at creation
+    import botocore.httpsession
+
+    if botocore.httpsession.BUFFER_SIZE is not None:
+        # urllib3 2.x: botocore passes this to urllib3 as an explicit blocksize
+        botocore.httpsession.BUFFER_SIZE = HTTP_BLOCKSIZE
+        return
+    # urllib3 1.x takes no blocksize; its connections inherit http.client's default
+    from http.client import HTTPConnection
+
+    HTTPConnection.__init__.__defaults__ = tuple(
+        HTTP_BLOCKSIZE if value == 8192 else value
+        for value in HTTPConnection.__init__.__defaults__
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_s3(max_pool_connections: int = DEFAULT_CONCURRENCY, accelerate: bool = False):
+    from botocore.config import Config as BotoConfig
+
+    # Reuse existing S3 session
+    from app.utils.s3 import session
+
+    # One client per pool size so repeated uploads reuse pooled TCP/TLS connections
+    config = BotoConfig(
+        max_pool_connections=max(16, max_pool_connections),
+        tcp_keepalive=True,
+        retries={"mode": "standard", "max_attempts": 5},
+    )
+    if accelerate:
+        # Route through S3 Transfer Acceleration edge endpoints (must be enabled on the bucket)
+        config = config.merge(
+            BotoConfig(s3={"use_accelerate_endpoint": True, "addressing_style": "virtual"})
+        )
+    _tune_http_buffers()
+    return session.client("s3", config=config)
+
+
+def _mmap_fd(fd: int) -> mmap.mmap:
+    # The mapping stays valid after the descriptor is closed
+    mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    if hasattr(mapped, "madvise"):
+        mapped.madvise(mmap.MADV_SEQUENTIAL)
+    return mapped
+
+
+def _mmap_file(filename: str) -> mmap.mmap:
+    with open(filename, "rb", buffering=0) as f:
+        return _mmap_fd(f.fileno())
+
+
+@functools.lru_cache(maxsize=None)
+def _mmap_osutil():
+    from s3transfer.utils import OSUtils
+
+    class MmapOSUtils(OSUtils):
+        """Serve multipart upload parts from a read-only mmap instead of buffered reads."""
+
+        def open(self, filename, mode):
+            if mode != "rb" or os.path.getsize(filename) == 0:
+                return super().open(filename, mode)
+            return _mmap_file(filename)
+
+    return MmapOSUtils()
+
+
+# Supported image extensions
+SUPPORTED_IMAGE_EXTENSIONS = frozenset(
+    sys.intern(ext) for ext in ('.png', '.jpg', '.jpeg', '.gif', '.webp', '.bmp')
+)
+
+
+def validate_inputs(local_path: str, is_image: bool = False, check_extension: bool = True) -> str:
+    # One realpath plus a single stat covers the exists and is-file checks
+    local_file_path = os.path.realpath(os.path.expanduser(local_path))
+    try:
+        st = os.stat(local_file_path)
+    except (FileNotFoundError, NotADirectoryError):
+        logger.error("File not found: %s", local_file_path)
+        sys.exit(1)
+    except OSError as e:
+        # e.g. symlink loops (ELOOP) or permission errors
+        logger.error("Cannot access file: %s (%s)", local_file_path, e.strerror or e)
+        sys.exit(1)
+    if not stat.S_ISREG(st.st_mode):
+        logger.error("Not a file: %s", local_file_path)
+        sys.exit(1)
+    
+    if not check_extension:
+        return local_file_path
+
+    # Check file type based on mode
+    suffix = sys.intern(os.path.splitext(local_file_path)[1].lower())
+    if is_image:
+        if suffix not in SUPPORTED_IMAGE_EXTENSIONS:
+            logger.error(
+                "Unsupported image format: %s. Supported: %s",
+                suffix,
+                ", ".join(SUPPORTED_IMAGE_EXTENSIONS),
+            )
+            sys.exit(1)
+    else:
+        if suffix != ".pdf":
+            logger.warning("The specified file does not have a .pdf extension.")
+    
+    return local_file_path
+
+
+# Fast path for the extensions these CLIs usually handle; avoids loading the mimetypes db
+_CT = {
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".bmp": "image/bmp",
+}
+
+
+def infer_content_type(suffix: str) -> str:
+    content_type = _CT.get(suffix)
+    if content_type is None:
+        # Unlisted suffixes (e.g. .docx) fall back to the mimetypes db, loaded on first miss
+        import mimetypes
+
+        content_type, _ = mimetypes.guess_type(f"file{suffix}")
+    return content_type or "application/octet-stream"
+
+
+def build_s3_key(local_file_path: str, s3_key: str | None, folder: str | None = None) -> str:
+    if s3_key:
+        # Normalize leading slash
+        return s3_key[1:] if s3_key.startswith("/") else s3_key
+    
+    # Build key with optional folder prefix
+    filename = os.path.basename(local_file_path)
+    if folder:
+        # Ensure folder doesn't have leading/trailing slashes
+        folder = folder.strip("/")
+        return f"{folder}/{filename}"
+    
+    return filename
+
+
+def _local_etag(local_file_path: str, part_size: int | None) -> str:
+    # Mirrors S3's ETag: plain MD5, or MD5 of part MD5s plus "-<parts>" for multipart
+    with open(local_file_path, "rb") as f:
+        if part_size is None:
+            return hashlib.file_digest(f, "md5").hexdigest()
+        part_digests = []
+        while chunk := f.read(part_size):
+            part_digests.append(hashlib.md5(chunk).digest())
+    return f"{hashlib.md5(b''.join(part_digests)).hexdigest()}-{len(part_digests)}"
+
+
+def object_is_current(
+    s3,
+    local_file_path: str,
+    bucket_name: str,
+    object_key: str,
+    transfer_config: TransferConfig,
+) -> bool:
+    from botocore.exceptions import ClientError
+    from s3transfer.utils import ChunksizeAdjuster
+
+    try:
+        head = s3.head_object(Bucket=bucket_name, Key=object_key)
+    except ClientError:
+        return False
+    size = os.path.getsize(local_file_path)
+    if head["ContentLength"] != size:
+        return False
+    remote_etag = head["ETag"].strip('"')
+    part_size = None
+    if "-" in remote_etag:
+        # Multipart ETags only match for the same part size; s3transfer clamps it to S3's limits
+        part_size = ChunksizeAdjuster().adjust_chunksize(transfer_config.multipart_chunksize, size)
+    return _local_etag(local_file_path, part_size) == remote_etag
+
+
+def _upload_object(
+    s3,
+    local_file_path: str,
+    bucket_name: str,
+    object_key: str,
+    transfer_config: TransferConfig,
+    skip_if_exists: bool = False,
+) -> str:
+    if skip_if_exists and object_is_current(
+        s3, local_file_path, bucket_name, object_key, transfer_config
+    ):
+        logger.info("Skipping upload, object is unchanged: s3://%s/%s", bucket_name, object_key)
+        return f"s3://{bucket_name}/{object_key}"
+
+    suffix = os.path.splitext(local_file_path)[1].lower()
+
+    content_type = infer_content_type(suffix)
+    logger.info(
+        "Uploading to S3 | bucket=%s key=%s content_type=%s",
+        bucket_name,
+        object_key,
+        content_type,
+    )
+
+    extra_args = {"ContentType": content_type}
+
+    size = os.stat(local_file_path).st_size
+    if size < transfer_config.multipart_threshold:
+        # Single PutObject; skips the s3transfer thread pool for small files
+        body = b""
+        if size:
+            # Open the file ourselves so the kernel gets a sequential readahead hint
+            fd = os.open(local_file_path, os.O_RDONLY)
+            try:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                body = _mmap_fd(fd)
+            finally:
+                os.close(fd)
+        try:
+            s3.put_object(
+                Bucket=bucket_name,
+                Key=object_key,
+                Body=body,
+                ContentLength=size,
+                **extra_args,
+            )
+        finally:
+            if size:
+                body.close()
+    else:
+        from boto3.s3.transfer import S3Transfer
+
+        with S3Transfer(s3, transfer_config, osutil=_mmap_osutil()) as transfer:
+            transfer.upload_file(
+                local_file_path,
+                bucket_name,
+                object_key,
+                extra_args=extra_args,
+            )
+
+    s3_path = f"s3://{bucket_name}/{object_key}"
+    logger.info("Upload complete: %s", s3_path)
+    return s3_path
+
+
+def upload_file_to_s3(
+    local_file_path: str,
+    bucket_name: str,
+    object_key: str,
+    transfer_config: TransferConfig | None = None,
+    skip_if_exists: bool = False,
+    accelerate: bool = False,
+) -> str:
+    transfer_config = transfer_config or build_transfer_config()
+    s3 = _get_s3(transfer_config.max_concurrency, accelerate)
+    try:
+        return _upload_object(
+            s3, local_file_path, bucket_name, object_key, transfer_config, skip_if_exists
+        )
+    except Exception as e:
+        logger.exception("Upload failed: %s", e)
+        sys.exit(1)
+
+
+def build_batch_keys(local_file_paths: list[str], folder: str | None = None) -> list[str]:
+    object_keys = [
+        build_s3_key(local_file_path, None, folder=folder) for local_file_path in local_file_paths
+    ]
+    # Two files with the same name would silently overwrite each other's object
+    duplicates = sorted(key for key, count in Counter(object_keys).items() if count > 1)
+    if duplicates:
+        logger.error("Several files map to the same S3 key: %s", ", ".join(duplicates))
+        sys.exit(1)
+    return object_keys
+
+
+def exit_on_batch_failures(failed: list[str], total: int) -> None:
+    if failed:
+        logger.error("%d of %d uploads failed: %s", len(failed), total, ", ".join(failed))
+        sys.exit(1)
+
+
+def upload_batch(
+    local_file_paths: list[str],
+    bucket_name: str,
+    folder: str | None = None,
+    transfer_config: TransferConfig | None = None,
+    max_workers: int = BATCH_WORKERS,
+    skip_if_exists: bool = False,
+    accelerate: bool = False,
+) -> None:
+    object_keys = build_batch_keys(local_file_paths, folder)
+    transfer_config = transfer_config or build_transfer_config()
+    workers = min(max_workers, len(local_file_paths))
+    # Every worker can run a full multipart transfer, so size the shared pool for all of them
+    s3 = _get_s3(workers * transfer_config.max_concurrency, accelerate)
+    failed = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(
+                _upload_object,
+                s3,
+                local_file_path,
+                bucket_name,
+                object_key,
+                transfer_config,
+                skip_if_exists,
+            ): local_file_path
+            for local_file_path, object_key in zip(local_file_paths, object_keys)
+        }
+        # Let every upload finish; one failure must not drop the files still queued
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("Upload failed: %s (%s)", futures[future], e)
+                failed.append(futures[future])
+
+    exit_on_batch_failures(failed, len(local_file_paths))
+
+
+def exec_presigned_upload(
+    local_file_path: str,
+    bucket_name: str,
+    object_key: str,
+    transfer_config: TransferConfig | None = None,
+    skip_if_exists: bool = False,
+    accelerate: bool = False,
+) -> None:
+    # Returns only when the object is already current; otherwise execvp replaces this process
+    s3 = _get_s3(accelerate=accelerate)
+    if skip_if_exists and object_is_current(
+        s3, local_file_path, bucket_name, object_key, transfer_config or build_transfer_config()
+    ):
+        logger.info("Skipping upload, object is unchanged: s3://%s/%s", bucket_name, object_key)
+        return
+
+    # Hand the transfer to curl via a presigned PUT
+    content_type = infer_content_type(os.path.splitext(local_file_path)[1].lower())
+    url = s3.generate_presigned_url(
+        "put_object",
+        Params={"Bucket": bucket_name, "Key": object_key, "ContentType": content_type},
+        ExpiresIn=PRESIGN_EXPIRES_IN,
+    )
+    logger.info("Handing off upload to curl: s3://%s/%s", bucket_name, object_key)
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+    try:
+        os.execvp(
+            "curl",
+            [
+                "curl",
+                "--fail",
+                # --upload-file streams the file and implies PUT
+                "-T",
+                local_file_path,
+                "-H",
+                f"Content-Type: {content_type}",
+                url,
+            ],
+        )
+    except OSError as e:
+        logger.error("Could not run curl for presigned upload: %s", e)
+        sys.exit(1)
+
+
+def resolve_bucket_name(bucket_name: str | None) -> str:
+    from app.config import settings
+
+    bucket_name = bucket_name or settings.AWS_BUCKET_NAME
+    if not bucket_name:
+        logger.error("Bucket name is not configured. Set AWS_BUCKET_NAME in your .env or pass --bucket.")
+        sys.exit(1)
+
+    # Log effective AWS configuration surface (safe subset)
+    logger.info(
+        "Using AWS configuration: region=%s env=%s bucket=%s",
+        settings.AWS_REGION,
+        settings.ENVIRONMENT,
+        bucket_name,
+    )
+    return bucket_name
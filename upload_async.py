@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+
+from s3_upload import (
+    DEFAULT_CONCURRENCY,
+    MIB,
+    MULTIPART_THRESHOLD,
+    build_batch_keys,
+    exit_on_batch_failures,
+    infer_content_type,
+    resolve_bucket_name,
+    validate_inputs,
+)
+from upload_cli import build_async_parser
+
+# aiobotocore and the app S3 session are imported inside the functions that use
+# them, like the boto3 imports in s3_upload
+logger = logging.getLogger("upload")
+
+
+def _read_file(local_file_path: str) -> bytes:
+    with open(local_file_path, "rb") as f:
+        return f.read()
+
+
+async def upload_one(
+    s3,
+    semaphore: asyncio.Semaphore,
+    local_file_path: str,
+    bucket_name: str,
+    object_key: str,
+) -> str:
+    content_type = infer_content_type(os.path.splitext(local_file_path)[1].lower())
+    async with semaphore:
+        # Whole-file PutObject: this path is meant for many small files
+        body = await asyncio.to_thread(_read_file, local_file_path)
+        await s3.put_object(
+            Bucket=bucket_name,
+            Key=object_key,
+            Body=body,
+            ContentType=content_type,
+        )
+    s3_path = f"s3://{bucket_name}/{object_key}"
+    logger.info("Upload complete: %s", s3_path)
+    return s3_path
+
+
+def _aio_client_options() -> tuple[str | None, dict]:
+    # Mirror the existing S3 session's profile and region
+    from app.utils.s3 import session
+
+    credentials = session.get_credentials()
+    if credentials is None:
+        logger.error("No AWS credentials found. Configure them via the app .env, environment or AWS profile.")
+        sys.exit(1)
+    profile = session.profile_name if session.profile_name in session.available_profiles else None
+    client_kwargs = {"region_name": session.region_name}
+    if credentials.method == "explicit":
+        # Keys passed straight to boto3 are static and invisible to aiobotocore's
+        # provider chain; anything else is resolved (and refreshed) by aiobotocore itself
+        frozen = credentials.get_frozen_credentials()
+        client_kwargs.update(
+            aws_access_key_id=frozen.access_key,
+            aws_secret_access_key=frozen.secret_key,
+            aws_session_token=frozen.token,
+        )
+    return profile, client_kwargs
+
+
+async def _bulk(
+    local_file_paths: list[str],
+    object_keys: list[str],
+    bucket_name: str,
+    profile: str | None,
+    client_kwargs: dict,
+    max_in_flight: int = DEFAULT_CONCURRENCY,
+) -> list[str]:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import AioSession
+
+    aio_session = AioSession(profile=profile)
+    config = AioConfig(
+        max_pool_connections=max_in_flight,
+        retries={"mode": "standard", "max_attempts": 5},
+    )
+    semaphore = asyncio.Semaphore(max_in_flight)
+    # One long-lived client keeps its pooled connections warm across every upload
+    async with aio_session.create_client("s3", config=config, **client_kwargs) as s3:
+        results = await asyncio.gather(
+            *(
+                upload_one(s3, semaphore, local_file_path, bucket_name, object_key)
+                for local_file_path, object_key in zip(local_file_paths, object_keys)
+            ),
+            # Let every upload finish; one failure must not cancel the rest
+            return_exceptions=True,
+        )
+
+    failed = []
+    for local_file_path, result in zip(local_file_paths, results):
+        if isinstance(result, BaseException):
+            logger.error("Upload failed: %s (%s)", local_file_path, result)
+            failed.append(local_file_path)
+    return failed
+
+
+def main() -> None:
+    args = build_async_parser().parse_args()
+
+    local_file_paths = [validate_inputs(path, check_extension=False) for path in args.files]
+    # Bodies are read whole and sent as one PutObject, so large files belong to the multipart path
+    too_large = [path for path in local_file_paths if os.path.getsize(path) >= MULTIPART_THRESHOLD]
+    if too_large:
+        logger.error(
+            "Files of %d MiB or more must be uploaded with test.py --files: %s",
+            MULTIPART_THRESHOLD // MIB,
+            ", ".join(too_large),
+        )
+        sys.exit(1)
+    object_keys = build_batch_keys(local_file_paths, args.folder)
+
+    bucket_name = resolve_bucket_name(args.bucket)
+    profile, client_kwargs = _aio_client_options()
+
+    try:
+        failed = asyncio.run(
+            _bulk(
+                local_file_paths,
+                object_keys,
+                bucket_name,
+                profile,
+                client_kwargs,
+                args.concurrency,
+            )
+        )
+    except Exception as e:
+        logger.exception("Upload failed: %s", e)
+        sys.exit(1)
+
+    exit_on_batch_failures(failed, len(local_file_paths))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)-8s | %(message)s")
+    main()
@@ -0,0 +1,161 @@
+# Command-line interface shared by test.py (PDFs) and test2.py (PDFs and images)
+import argparse
+import logging
+import sys
+
+from s3_upload import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_IO_CHUNKSIZE_KB,
+    DEFAULT_PART_SIZE_MB,
+    MIB,
+    MULTIPART_THRESHOLD,
+)
+
+logger = logging.getLogger("upload")
+
+
+def positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
+
+def _add_folder_argument(parser: argparse.ArgumentParser, default: str | None) -> None:
+    default_help = f"'{default}'" if default else "the bucket root"
+    parser.add_argument(
+        "--folder",
+        required=False,
+        default=default,
+        help=f"S3 folder to upload to. Defaults to {default_help}.",
+    )
+
+
+def _add_bucket_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--bucket",
+        required=False,
+        help=(
+            "Override bucket name. By default uses settings.AWS_BUCKET_NAME "
+            "from the app configuration."
+        ),
+    )
+
+
+def _add_concurrency_argument(parser: argparse.ArgumentParser, help_text: str) -> None:
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"{help_text} Defaults to {DEFAULT_CONCURRENCY}.",
+    )
+
+
+def build_parser(image_mode: bool) -> argparse.ArgumentParser:
+    # image_mode adds test2.py's --folder/--image flags and its image-oriented help text
+    if image_mode:
+        description = "Upload a local file (PDF or image) to the configured S3 bucket."
+        file_help = "Absolute path to the local file (e.g., /home/user/docs/file.pdf or /home/user/images/chart.png)"
+        key_help = "S3 object key (path in bucket). Defaults to folder/filename."
+    else:
+        description = "Upload a local PDF (or any file) to the configured S3 bucket."
+        file_help = "Absolute path to the local file (e.g., /home/user/docs/file.pdf)"
+        key_help = "S3 object key (path in bucket). Defaults to the local filename at bucket root."
+
+    parser = argparse.ArgumentParser(description=description)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--file",
+        help=file_help,
+    )
+    source.add_argument(
+        "--files",
+        nargs="+",
+        metavar="FILE",
+        help="Upload several local files in parallel over one shared S3 client.",
+    )
+    parser.add_argument(
+        "--key",
+        required=False,
+        help=key_help,
+    )
+    if image_mode:
+        _add_folder_argument(parser, "dummy_image")
+    _add_bucket_argument(parser)
+    if image_mode:
+        parser.add_argument(
+            "--image",
+            action="store_true",
+            help="Treat file as an image (validates image extensions)",
+        )
+    parser.add_argument(
+        "--part-size-mb",
+        type=positive_int,
+        default=DEFAULT_PART_SIZE_MB,
+        help=f"Multipart chunk size in MiB. Defaults to {DEFAULT_PART_SIZE_MB}.",
+    )
+    _add_concurrency_argument(parser, "Number of parallel upload threads.")
+    parser.add_argument(
+        "--io-chunksize-kb",
+        type=positive_int,
+        default=DEFAULT_IO_CHUNKSIZE_KB,
+        help=f"Read buffer size in KiB for each part. Defaults to {DEFAULT_IO_CHUNKSIZE_KB}.",
+    )
+    parser.add_argument(
+        "--presign",
+        action="store_true",
+        help="Upload with curl through a presigned PUT URL instead of boto3 (single file only).",
+    )
+    parser.add_argument(
+        "--skip-if-exists",
+        action="store_true",
+        help="Skip files whose S3 object already has the same size and ETag.",
+    )
+    parser.add_argument(
+        "--accelerate",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="Use the S3 Transfer Acceleration endpoint (must be enabled on the bucket).",
+    )
+    return parser
+
+
+def build_async_parser() -> argparse.ArgumentParser:
+    # upload_async.py: only the flags that apply to whole-file PutObject fan-out
+    parser = argparse.ArgumentParser(
+        description="Upload many small local files to the configured S3 bucket with asyncio."
+    )
+    parser.add_argument(
+        "--files",
+        nargs="+",
+        metavar="FILE",
+        required=True,
+        help=(
+            "Local files to upload. Each file is read into memory and sent with one PutObject, "
+            f"so files must be smaller than {MULTIPART_THRESHOLD // MIB} MiB."
+        ),
+    )
+    _add_folder_argument(parser, None)
+    _add_bucket_argument(parser)
+    _add_concurrency_argument(parser, "Maximum uploads in flight.")
+    return parser
+
+
+def parse_args(image_mode: bool) -> argparse.Namespace:
+    args = build_parser(image_mode).parse_args()
+
+    if args.files and args.presign:
+        logger.error("--presign can only be used with --file.")
+        sys.exit(1)
+
+    if args.files and args.key:
+        if image_mode:
+            logger.error("--key can only be used with --file; batch uploads use folder/filename keys.")
+        else:
+            logger.error("--key can only be used with --file; batch uploads use the filename as key.")
+        sys.exit(1)
+
+    return args